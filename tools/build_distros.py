@@ -13,20 +13,51 @@ fully rendered static pages for SEO and offline use.
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import html
+import importlib.util
 import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from textwrap import dedent
 import base64
 from io import BytesIO
+from urllib.error import HTTPError
 from urllib.parse import quote_plus, urlencode, urlparse
 from urllib.request import Request, urlopen
 
+# Only the tiny PIL package is imported here; the imaging modules load on
+# first use through _get_pil(), so builds where every OG image and logo is
+# cached never pay for them.
 try:
-    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+    import PIL
+except ImportError:
+    PIL = None
+
+# OG images get a WebP copy (and a matching og:image tag) when Pillow can encode it.
+# Look for the libwebp binding without importing it.
+OG_WEBP = PIL is not None and importlib.util.find_spec("PIL._webp") is not None
+
+try:
+    import orjson
 except ImportError:
-    Image = None
+    orjson = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 API_PATH = PROJECT_ROOT / "api" / "linux_distros_full.json"
@@ -37,101 +68,360 @@ BASE_URL = "https://bestlinuxdistros.com"
 ASSET_ROOT = PROJECT_ROOT / "assets"
 OG_DIR = ASSET_ROOT / "og"
 LOGO_DIR = ASSET_ROOT / "logos"
+FETCH_WORKERS = 16
+# Be polite to Wikipedia/Wikimedia: at most 8 logo, screenshot or API requests in flight.
+MEDIA_FETCH_SLOTS = threading.BoundedSemaphore(8)
+# Set by --offline: only use cached downloads, never touch the network.
+OFFLINE = False
 UA_HEADER = {"User-Agent": "bestlinuxdistros-bot/1.0"}
 CLEARBIT_BASE = "https://logo.clearbit.com/"
 BLANK_PNG = base64.b64decode(
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4AWNgYGD4DwABBAEAAlSCDQAAAABJRU5ErkJggg=="
 )
+UTF8_BOM = b"\xef\xbb\xbf"
 LOGO_SUFFIXES = {".svg", ".png", ".jpg", ".jpeg", ".webp"}
+CACHE_DIR = Path(__file__).resolve().parent / ".bld-cache"
+PAGE_CACHE_DIR = CACHE_DIR / "pages"
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+# Wikipedia responses and screenshots are reused for a week before revalidating.
+HTTP_CACHE_TTL = 7 * 24 * 60 * 60
+# OG artwork is 1200x630; a screenshot larger than this is not worth downloading.
+OG_SOURCE_MAX_BYTES = 8 * 1024 * 1024
+LAST_UPDATED_PLACEHOLDER = "__LAST_UPDATED__"
+# Bump when the OG image artwork changes so cached images are redrawn.
+OG_STYLE_VERSION = 4
+OG_SIZE = (1200, 630)
+OG_DARKEN_ALPHA = 200 / 255
+# Any edit to this generator invalidates previously cached pages.
+TEMPLATE_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def build_session():
+    """Shared keep-alive session so each host costs one TLS handshake per build."""
+    if requests is None:
+        return None
+    session = requests.Session()
+    session.headers.update(UA_HEADER)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # Wikimedia sheds load with 429/503 + Retry-After; back off instead of failing the image.
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = build_session()
+
 
 # Manual metadata that is not bundled with the upstream feed.
 # release_model -> {"LTS","Rolling","Release","Hybrid"}
 # popularity_rank -> smaller number == more popular
-METADATA = {
-    "ubuntu": {"release_model": "LTS", "popularity_rank": 1},
-    "debian": {"release_model": "LTS", "popularity_rank": 2},
-    "fedora": {"release_model": "Release", "popularity_rank": 3},
-    "arch": {"release_model": "Rolling", "popularity_rank": 4},
-    "manjaro": {"release_model": "Rolling", "popularity_rank": 5},
-    "mint": {"release_model": "LTS", "popularity_rank": 6},
-    "popos": {"release_model": "LTS", "popularity_rank": 7},
-    "zorin": {"release_model": "LTS", "popularity_rank": 8},
-    "kali": {"release_model": "Rolling", "popularity_rank": 9},
-    "rhel": {"release_model": "LTS", "popularity_rank": 10},
-    "elementary": {"release_model": "LTS", "popularity_rank": 11},
-    "mxlinux": {"release_model": "LTS", "popularity_rank": 12},
-    "opensuse": {"release_model": "Hybrid", "popularity_rank": 13},
-    "gentoo": {"release_model": "Rolling", "popularity_rank": 14},
-    "slackware": {"release_model": "Release", "popularity_rank": 15},
-    "alpine": {"release_model": "Rolling", "popularity_rank": 16},
-    "tails": {"release_model": "Rolling", "popularity_rank": 17},
-    "parrot": {"release_model": "Rolling", "popularity_rank": 18},
-    "nixos": {"release_model": "Rolling", "popularity_rank": 19},
-    "clearlinux": {"release_model": "Rolling", "popularity_rank": 20},
-    "centos": {"release_model": "LTS", "popularity_rank": 21},
-    "almalinux": {"release_model": "LTS", "popularity_rank": 22},
-    "rocky": {"release_model": "LTS", "popularity_rank": 23},
-    "endeavouros": {"release_model": "Rolling", "popularity_rank": 24},
-    "garuda": {"release_model": "Rolling", "popularity_rank": 25},
-    "void": {"release_model": "Rolling", "popularity_rank": 26},
-    "solus": {"release_model": "Rolling", "popularity_rank": 27},
-    "deepin": {"release_model": "Release", "popularity_rank": 28},
-    "peppermint": {"release_model": "LTS", "popularity_rank": 29},
-    "qubes": {"release_model": "Release", "popularity_rank": 30},
+# wiki_title -> Wikipedia article used for screenshots
+# is_beginner / is_server / is_security -> force the matching badge
+@dataclass(slots=True, frozen=True)
+class DistroMeta:
+    release_model: str
+    popularity_rank: int
+    wiki_title: str | None = None
+    is_beginner: bool = False
+    is_server: bool = False
+    is_security: bool = False
+
+
+DISTRO_META = {
+    "ubuntu": DistroMeta("LTS", 1, "Ubuntu", is_beginner=True),
+    "debian": DistroMeta("LTS", 2, "Debian", is_server=True),
+    "fedora": DistroMeta("Release", 3, "Fedora Linux"),
+    "arch": DistroMeta("Rolling", 4, "Arch Linux"),
+    "manjaro": DistroMeta("Rolling", 5, "Manjaro (operating system)"),
+    "mint": DistroMeta("LTS", 6, "Linux Mint", is_beginner=True),
+    "popos": DistroMeta("LTS", 7, "Pop!_OS", is_beginner=True),
+    "zorin": DistroMeta("LTS", 8, "Zorin OS", is_beginner=True),
+    "kali": DistroMeta("Rolling", 9, "Kali Linux", is_security=True),
+    "rhel": DistroMeta("LTS", 10, "Red Hat Enterprise Linux", is_server=True),
+    "elementary": DistroMeta("LTS", 11, "Elementary OS", is_beginner=True),
+    "mxlinux": DistroMeta("LTS", 12, "MX Linux", is_beginner=True),
+    "opensuse": DistroMeta("Hybrid", 13, "OpenSUSE"),
+    "gentoo": DistroMeta("Rolling", 14, "Gentoo Linux"),
+    "slackware": DistroMeta("Release", 15, "Slackware"),
+    "alpine": DistroMeta("Rolling", 16, "Alpine Linux"),
+    "tails": DistroMeta("Rolling", 17, "Tails (operating system)", is_security=True),
+    "parrot": DistroMeta("Rolling", 18, "Parrot Security OS", is_security=True),
+    "nixos": DistroMeta("Rolling", 19, "NixOS"),
+    "clearlinux": DistroMeta("Rolling", 20, "Clear Linux", is_server=True),
+    "centos": DistroMeta("LTS", 21, "CentOS", is_server=True),
+    "almalinux": DistroMeta("LTS", 22, "AlmaLinux", is_server=True),
+    "rocky": DistroMeta("LTS", 23, "Rocky Linux", is_server=True),
+    "endeavouros": DistroMeta("Rolling", 24, "EndeavourOS"),
+    "garuda": DistroMeta("Rolling", 25, "Garuda Linux"),
+    "void": DistroMeta("Rolling", 26, "Void Linux"),
+    "solus": DistroMeta("Rolling", 27, "Solus (operating system)", is_beginner=True),
+    "deepin": DistroMeta("Release", 28, "Deepin (operating system)", is_beginner=True),
+    "peppermint": DistroMeta("LTS", 29, "Peppermint OS", is_beginner=True),
+    "qubes": DistroMeta("Release", 30, "Qubes OS", is_security=True),
 }
 
-BEGINNER_HINTS = {
-    "ubuntu",
-    "mint",
-    "popos",
-    "zorin",
-    "elementary",
-    "mxlinux",
-    "peppermint",
-    "deepin",
-    "solus",
-}
-SERVER_HINTS = {"debian", "rhel", "centos", "almalinux", "rocky", "clearlinux"}
-SECURITY_HINTS = {"kali", "tails", "parrot", "qubes"}
-
-WIKI_TITLES = {
-    "ubuntu": "Ubuntu",
-    "debian": "Debian",
-    "fedora": "Fedora Linux",
-    "arch": "Arch Linux",
-    "manjaro": "Manjaro (operating system)",
-    "mint": "Linux Mint",
-    "popos": "Pop!_OS",
-    "zorin": "Zorin OS",
-    "elementary": "Elementary OS",
-    "mxlinux": "MX Linux",
-    "opensuse": "OpenSUSE",
-    "gentoo": "Gentoo Linux",
-    "slackware": "Slackware",
-    "alpine": "Alpine Linux",
-    "tails": "Tails (operating system)",
-    "parrot": "Parrot Security OS",
-    "nixos": "NixOS",
-    "clearlinux": "Clear Linux",
-    "centos": "CentOS",
-    "almalinux": "AlmaLinux",
-    "rocky": "Rocky Linux",
-    "kali": "Kali Linux",
-    "rhel": "Red Hat Enterprise Linux",
-    "endeavouros": "EndeavourOS",
-    "garuda": "Garuda Linux",
-    "void": "Void Linux",
-    "solus": "Solus (operating system)",
-    "deepin": "Deepin (operating system)",
-    "peppermint": "Peppermint OS",
-    "qubes": "Qubes OS",
-}
+BADGED_RELEASE_MODELS = frozenset({"LTS", "Rolling"})
+
+
+# Detail page markup. The site header and footer are identical on every page,
+# so they are plain constants; only the head and main blocks are formatted per
+# distro. The "__LAST_UPDATED__" literals in SITE_FOOTER must match
+# LAST_UPDATED_PLACEHOLDER; write_detail_page swaps in the build date.
+DETAIL_HEAD_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+  <title>{name} Linux Review | BESTLINUXDISTROS</title>
+  <meta name="description" content="{meta_description}" />
+  <meta name="keywords" content="{meta_keywords}" />
+  <meta property="og:title" content="{name} Linux Review � BestLinuxDistros" />
+  <meta property="og:description" content="{meta_description}" />
+  <meta property="og:type" content="website" />
+  <meta property="og:url" content="{page_url}" />
+  {og_image_markup}
+  <meta property="twitter:card" content="summary_large_image" />
+  <link rel="canonical" href="{page_url}" />
+  <link rel="preconnect" href="https://fonts.googleapis.com" />
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin />
+  <link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600;700&display=swap" />
+  <link rel="stylesheet" href="../css/styles.css" />
+  <script type="application/ld+json">
+  {schema_json}
+  </script>
+</head>
+<body class="page detail" data-distro="{distro_id}">
+"""
+
+SITE_HEADER = """\
+  <header class="site-header floating">
+    <div class="logo-mark"><a href="../index.html">bestlinuxdistros<span class="dot">.com</span></a></div>
+    <button class="nav-toggle" id="navToggle" aria-expanded="false" aria-label="Toggle navigation" aria-controls="site-nav">
+      <span></span><span></span><span></span>
+    </button>
+    <nav class="primary-nav" id="site-nav">
+      <a href="../index.html">Home</a>
+      <a href="../distros.html">Distros</a>
+      <a href="../compare.html">Compare</a>
+      <a href="../blog/index.html">Blog</a>
+      <a href="../index.html#guides">Guides</a>
+      <a href="../index.html#tools">Tools</a>
+      <a href="../distros.html#search" data-nav-search>Search</a>
+    </nav>
+  </header>
+"""
+
+DETAIL_BODY_TEMPLATE = """\
+  <main class="detail-main">
+    <a class="back-link" href="../distros.html">&larr; Back to catalog</a>
+    <section class="detail-card detail-hero">
+      <div class="hero-stack">
+        <div class="hero-logo" data-name="{name}">
+          <img src="{hero_logo}" alt="{name} logo" loading="lazy" decoding="async" referrerpolicy="no-referrer" data-domain="{domain}" />
+        </div>
+        <div class="hero-content">
+          <div class="eyebrow">{category_markup}</div>
+          <h1>{name}</h1>
+          <p class="lede">{lede_copy}</p>
+          {tag_badges_markup}
+          <div class="badge-row">
+            <span class="status-badge" data-status="{status}">{status}</span>
+            {badge_markup}
+          </div>
+          <div class="hero-meta-grid">
+            {hero_meta_markup}
+          </div>
+          <div class="hero-actions">
+            {hero_actions_markup}
+          </div>
+        </div>
+      </div>
+    </section>
+    <nav class="breadcrumb">
+      <a href="../index.html">Home</a>
+      <span>&rsaquo;</span>
+      <a href="../distros.html">Distros</a>
+      <span>&rsaquo;</span>
+      <span>{name}</span>
+    </nav>
+    <section class="detail-card overview-panel">
+      <div class="section-heading">
+        <h2>Overview</h2>
+        <p>This snapshot highlights the {release_model} cadence, default desktop, and tooling so you know what to expect before installing.</p>
+      </div>
+      <div class="info-grid">
+        {info_markup}
+      </div>
+    </section>
+    <section class="detail-card audience-panel">
+      <h2>Audience fit</h2>
+      <div class="user-badges">
+        {target_markup}
+      </div>
+      <div class="compat-grid">
+        <article>
+          <h3>Best suited for</h3>
+          <ul>{best_markup}</ul>
+        </article>
+        <article>
+          <h3>Consider alternatives if</h3>
+          <ul>{not_ideal_markup}</ul>
+        </article>
+        <article>
+          <h3>Common deployments</h3>
+          <ul>{use_case_markup}</ul>
+        </article>
+      </div>
+    </section>
+    <section class="detail-card pros-cons">
+      <div>
+        <h3>Pros</h3>
+        <ul>{pros_markup}</ul>
+      </div>
+      <div>
+        <h3>Cons</h3>
+        <ul>{cons_markup}</ul>
+      </div>
+    </section>
+    <section class="detail-card hardware-panel">
+      <h2>Hardware requirements</h2>
+      <table class="hw-table">
+        <thead>
+          <tr>
+            <th>Spec</th>
+            <th>Minimum</th>
+            <th>Recommended</th>
+          </tr>
+        </thead>
+        <tbody>
+          {hw_markup}
+        </tbody>
+      </table>
+    </section>
+    <section class="detail-card package-panel">
+      <h2>Package manager &amp; ecosystem</h2>
+      <p class="package-name">{package_name}</p>
+      <p>{package_blurb}</p>
+    </section>
+    <section class="detail-card screenshots-panel">
+      <div class="section-heading">
+        <h2>Screenshots</h2>
+        <p>Tap or click to open full-size UI captures.</p>
+      </div>
+      <div class="screenshots-grid">
+        {screenshot_markup}
+      </div>
+    </section>
+    <section class="detail-card benchmark-panel">
+      <h2>Benchmarks &amp; signals</h2>
+      <div class="benchmark-grid">
+        <article>
+          <p class="muted-label">Boot time</p>
+          <span class="pill soft">{boot_time}</span>
+        </article>
+        <article>
+          <p class="muted-label">Resource usage</p>
+          <span class="pill soft">{resource_usage}</span>
+        </article>
+      </div>
+      <div class="score-list">
+        {score_markup}
+      </div>
+    </section>
+    {related_markup}
+    <a class="back-link bottom" href="../distros.html">&larr; Back to catalog</a>
+  </main>
+"""
+
+SITE_FOOTER = """\
+  <footer class="site-footer">
+    <div>
+      <p>Made by Saif &middot;  </p>
+      <p class="last-updated" data-last-updated="__LAST_UPDATED__">Last updated __LAST_UPDATED__</p>
+    </div>
+    <div class="footer-links">
+      <a href="../index.html#about">About</a>
+      <a href="mailto:hello@bestlinuxdistros.com">Contact</a>
+      <a href="../index.html#privacy">Privacy</a>
+      <a href="../sitemap.xml">Sitemap</a>
+      <a href="https://github.com/bestlinuxdistros" target="_blank" rel="noopener">GitHub</a>
+    </div>
+    <p class="footer-note">&copy; 2025 BestLinuxDistros.com &mdash; Open-Source Project. Made for Linux users, by Linux users.</p>
+  </footer>
+  <script src="../js/distro-data.js" defer></script>
+  <script src="../js/app.js" defer></script>
+  <script src="../js/detail.js" defer></script>
+</body>
+</html>
+"""
 
+# schema.org JSON-LD for detail pages. The constant fields are serialized here
+# once; render_detail_page only JSON-encodes the per-distro values.
+SCHEMA_TEMPLATE = (
+    '[{"@context":"https://schema.org","@type":"SoftwareApplication",'
+    '"applicationCategory":"UtilitiesApplication","operatingSystem":"GNU/Linux",'
+    '"name":%(name)s,"description":%(description)s,"image":%(logo)s,"url":%(url)s,'
+    '"softwareVersion":%(version)s,"publisher":{"@type":"Organization","name":"BESTLINUXDISTROS"},'
+    '"offers":{"@type":"Offer","price":"0","priceCurrency":"USD"},'
+    '"releaseNotes":%(release_notes)s,"downloadUrl":%(download_url)s,'
+    '"screenshot":%(screenshots)s,"keywords":%(keywords)s%(provider)s},'
+    '{"@context":"https://schema.org","@type":"OperatingSystem","name":%(name)s,"url":%(url)s,'
+    '"description":%(description)s,"operatingSystemType":%(os_type)s,'
+    '"screenshot":%(screenshots)s,"softwareVersion":%(version)s,"image":%(og_image)s%(manufacturer)s}]'
+)
+
+# Label/value card shared by the hero meta grid and the overview panel.
+DATA_CARD_TEMPLATE = """
+        <article>
+          <p class="muted-label">{label}</p>
+          <p class="data-value">{value}</p>
+        </article>
+        """
+
+# "You may also like" panel. Each distro's card is formatted once per build
+# (see build_columns) and reused on every page that links to it.
+RELATED_CARD_TEMPLATE = """
+                <article class="distro-card">
+                  <div class="distro-logo">
+                    <img src="{logo}" alt="{name} logo" loading="lazy" decoding="async" referrerpolicy="no-referrer" />
+                  </div>
+                  <h3>{name}</h3>
+                  <p class="muted-label">{family}</p>
+                  <a class="link-arrow" href="../distros/{id}.html">View details &rsaquo;</a>
+                </article>
+        """
+
+RELATED_PANEL_TEMPLATE = """
+            <section class="detail-card related-panel">
+              <div class="section-heading">
+                <h2>You may also like</h2>
+                <p>Explore similar distributions with shared traits.</p>
+              </div>
+              <div class="related-grid">
+                {cards}
+              </div>
+            </section>
+    """
 
-def main() -> None:
-    distros = json.loads(API_PATH.read_text(encoding="utf-8-sig"))
+
+def main(argv: list[str] | None = None) -> None:
+    global OFFLINE
+    args = parse_args(argv)
+    OFFLINE = args.offline
+
+    distros = load_json_bytes(API_PATH.read_bytes().removeprefix(UTF8_BOM))
     ids = {item["id"] for item in distros}
-    missing = ids.difference(METADATA)
+    missing = ids - DISTRO_META.keys()
     if missing:
         raise SystemExit(f"Metadata missing for ids: {sorted(missing)}")
 
@@ -139,47 +429,236 @@ def main() -> None:
     last_updated_display = now.strftime("%B %d, %Y")
     generated_at_iso = now.isoformat()
 
-    enriched = []
     for entry in distros:
         entry["website"] = normalize_url(entry.get("website", ""))
         entry["download_url"] = normalize_url(entry.get("download_url", ""))
-        original_logo = (entry.get("logo") or "").strip()
-        entry["logo_source"] = original_logo
-        cached_logo = ensure_local_logo(entry["id"], original_logo, entry["website"], entry.get("name"))
+        entry["logo_source"] = (entry.get("logo") or "").strip()
+
+    # Offline builds without a cached Wikipedia response keep the screenshots
+    # the last published build found, instead of falling back to placeholders.
+    previous_screenshots = load_snapshot_screenshots() if OFFLINE else {}
+
+    # Logo and screenshot lookups are network-bound. Every Wikipedia query is
+    # queued up front next to the logo downloads so neither waits on the other.
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        screenshot_jobs = [
+            pool.submit(lookup_screenshots, entry, previous_screenshots) for entry in distros
+        ]
+        cached_logos = list(pool.map(cache_logo, distros))
+        fetched_screenshots = [job.result() for job in screenshot_jobs]
+
+    enriched = []
+    for entry, cached_logo, fetched in zip(distros, cached_logos, fetched_screenshots):
         if cached_logo:
             entry["logo"] = cached_logo
             entry["logo_local"] = cached_logo
         else:
-            entry["logo"] = original_logo
+            entry["logo"] = entry["logo_source"]
             entry["logo_local"] = ""
-        wiki_title = WIKI_TITLES.get(entry["id"])
-        if wiki_title:
-            print(f"[BLD] Fetching screenshots for: {entry['id']}")
-            print(f"[BLD] Wikipedia title: {wiki_title}")
-            fetched = fetch_wiki_screenshots(wiki_title)
-            print(f"[BLD] Found {len(fetched)} screenshot(s)")
-            if fetched:
-                entry["screenshots"] = fetched
-        meta = METADATA[entry["id"]]
-        enriched_entry = {**entry, **meta}
+        if fetched:
+            entry["screenshots"] = fetched
+        meta = DISTRO_META[entry["id"]]
+        enriched_entry = {
+            **entry,
+            "release_model": meta.release_model,
+            "popularity_rank": meta.popularity_rank,
+        }
         enriched.append(enriched_entry)
 
-    for enriched_entry in enriched:
-        generate_og_image(enriched_entry, enriched_entry.get("screenshots") or [])
-        html_page = render_detail_page(enriched_entry, last_updated_display, enriched)
-        (DISTRO_DIR / f"{enriched_entry['id']}.html").write_text(html_page, encoding="utf-8")
+    # Pull OG screenshot sources into the HTTP cache while still in the I/O phase,
+    # so render workers below only do CPU work.
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        list(pool.map(prefetch_og_source, enriched))
+
+    print(f"[BLD] Imaging: {describe_imaging()}")
+    # OG images and page rendering are CPU-bound, so fan them out across processes.
+    # Workers receive the shared state once through the pool initializer.
+    related_digest = related_fingerprint(enriched)
+    columns = build_columns(enriched)
+    OG_DIR.mkdir(parents=True, exist_ok=True)
+    PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=init_render_worker,
+        initargs=(enriched, columns, last_updated_display, related_digest, OFFLINE),
+    ) as pool:
+        cache_hits = sum(pool.map(render_one, range(len(enriched))))
+    print(f"[BLD] cache: {cache_hits}/{len(enriched)} pages")
 
     write_snapshot(enriched, generated_at_iso, last_updated_display)
     write_sitemap(enriched, now.date().isoformat())
 
 
-def render_detail_page(distro: dict, last_updated: str, all_distros: list[dict]) -> str:
-    """Render the HTML for a single distro detail page."""
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build bestlinuxdistros.com detail pages.")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="use cached logos and Wikipedia responses only; never hit the network",
+    )
+    return parser.parse_args(argv)
+
+
+def describe_imaging() -> str:
+    if PIL is None:
+        return "Pillow not installed, OG images fall back to raw screenshots"
+    # Pillow-SIMD publishes as <pillow version>.postN.
+    flavour = "Pillow-SIMD" if ".post" in PIL.__version__ else "Pillow"
+    return f"{flavour} {PIL.__version__}"
+
+
+def cache_logo(entry: dict) -> str:
+    return ensure_local_logo(entry["id"], entry["logo_source"], entry["website"], entry.get("name"))
+
+
+def lookup_screenshots(entry: dict, previous_screenshots: dict[str, list[str]]) -> list[str]:
+    wiki_title = DISTRO_META[entry["id"]].wiki_title
+    if not wiki_title:
+        return []
+    if OFFLINE and not http_cache_path(wiki_screenshots_url(wiki_title)).exists():
+        kept = previous_screenshots.get(entry["id"], [])
+        print(
+            f"[BLD] Offline: no cached Wikipedia response for {entry['id']}, "
+            f"keeping {len(kept)} screenshot(s) from {SNAPSHOT_PATH.name}"
+        )
+        return kept
+    print(f"[BLD] Fetching screenshots for: {entry['id']}")
+    print(f"[BLD] Wikipedia title: {wiki_title}")
+    fetched = fetch_wiki_screenshots(wiki_title)
+    print(f"[BLD] Found {len(fetched)} screenshot(s) for: {entry['id']}")
+    return fetched
+
+
+_RENDER_STATE: dict = {}
+
+
+def init_render_worker(
+    all_distros: list[dict],
+    columns: dict[str, list],
+    last_updated: str,
+    related_digest: str,
+    offline: bool,
+) -> None:
+    global OFFLINE
+    OFFLINE = offline
+    _RENDER_STATE["all_distros"] = all_distros
+    _RENDER_STATE["columns"] = columns
+    _RENDER_STATE["last_updated"] = last_updated
+    _RENDER_STATE["related_digest"] = related_digest
+
+
+def render_one(index: int) -> bool:
+    """Generate the OG image and detail page for one distro inside a worker process."""
+    all_distros = _RENDER_STATE["all_distros"]
+    distro = all_distros[index]
+    generate_og_image(distro, distro.get("screenshots") or [])
+    return write_detail_page(
+        index,
+        _RENDER_STATE["columns"],
+        _RENDER_STATE["last_updated"],
+        all_distros,
+        _RENDER_STATE["related_digest"],
+    )
+
+
+def build_columns(distros: list[dict]) -> dict[str, list]:
+    """
+    Struct-of-arrays view of the fields every page prints verbatim,
+    escaped once per build. Row i belongs to distros[i].
+    """
+    columns = {
+        "name_esc": [safe_text(item["name"]) for item in distros],
+        "status_esc": [safe_text(item.get("status", "Active")) for item in distros],
+        "release_model_esc": [safe_text(item.get("release_model", "LTS")) for item in distros],
+        "logo_esc": [html.escape(detail_logo_src(item.get("logo", ""))) for item in distros],
+        "domain_esc": [html.escape(extract_domain(item.get("website", ""))) for item in distros],
+        # Related-card matching keys, normalized once instead of per pair of distros.
+        "family_lc": [(item.get("family") or "").lower() for item in distros],
+        "badges_lc": [frozenset(b.lower() for b in (item.get("badges") or [])) for item in distros],
+        # Row indices, most popular first, for topping up short related lists.
+        "by_popularity": sorted(
+            range(len(distros)), key=lambda i: distros[i].get("popularity_rank", 999)
+        ),
+    }
+    columns["related_card"] = [
+        RELATED_CARD_TEMPLATE.format(
+            logo=logo,
+            name=name,
+            family=safe_text(item.get("family") or item.get("category") or ""),
+            id=item["id"],
+        )
+        for item, name, logo in zip(distros, columns["name_esc"], columns["logo_esc"])
+    ]
+    return columns
+
+
+def write_detail_page(
+    index: int,
+    columns: dict[str, list],
+    last_updated: str,
+    all_distros: list[dict],
+    related_digest: str,
+) -> bool:
+    """
+    Write distros/<id>.html, skipping the render when its inputs are unchanged.
+    Returns True when the page came from the cache.
+    """
+    distro = all_distros[index]
+    target = DISTRO_DIR / f"{distro['id']}.html"
+    stamp = PAGE_CACHE_DIR / f"{distro['id']}.sha256"
+    key = page_cache_key(distro, related_digest)
+    if target.exists() and stamp.exists() and stamp.read_text(encoding="utf-8") == key:
+        return True
+    body_cache = PAGE_CACHE_DIR / f"{key}.html"
+    if body_cache.exists():
+        html_page = body_cache.read_text(encoding="utf-8")
+        hit = True
+    else:
+        html_page = render_detail_page(index, columns, all_distros)
+        write_file(body_cache, html_page)
+        hit = False
+    write_file(target, html_page.replace(LAST_UPDATED_PLACEHOLDER, last_updated))
+    write_file(stamp, key)
+    return hit
+
+
+def page_cache_key(distro: dict, related_digest: str) -> str:
+    digest = hashlib.sha256(TEMPLATE_VERSION.encode())
+    digest.update(related_digest.encode())
+    digest.update(b"webp" if OG_WEBP else b"png")
+    digest.update(json.dumps(distro, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def related_fingerprint(distros: list[dict]) -> str:
+    """Hash the fields build_related_distro_cards reads from every distro."""
+    fields = [
+        [
+            item["id"],
+            item.get("name"),
+            item.get("logo"),
+            item.get("family"),
+            item.get("category"),
+            item.get("badges"),
+            item.get("popularity_rank"),
+        ]
+        for item in distros
+    ]
+    return hashlib.sha256(json.dumps(fields, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def render_detail_page(index: int, columns: dict[str, list], all_distros: list[dict]) -> str:
+    """
+    Render the HTML for all_distros[index], reading pre-escaped fields from columns.
+    The footer date is left as LAST_UPDATED_PLACEHOLDER so the result can be cached.
+    """
+    distro = all_distros[index]
     name = distro["name"]
+    name_esc = columns["name_esc"][index]
     raw_desc = distro.get("description", "") or ""
     escaped_desc = safe_text(raw_desc)
     release_model = distro.get("release_model", "LTS")
-    status = safe_text(distro.get("status", "Active"))
+    status = columns["status_esc"][index]
     meta_description_text = distro.get("seo_description") or (
         f"{name} Linux review covering a {release_model} cadence, hardware requirements, package tooling, and recommended use cases."
     )
@@ -187,50 +666,42 @@ def render_detail_page(distro: dict, last_updated: str, all_distros: list[dict])
     lede_copy = escaped_desc or meta_description
     badges = build_badges(distro, release_model)
     badge_markup = "".join(
-        f'<span class="pill" data-pill="{html.escape(badge)}">{html.escape(badge)}</span>'
-        for badge in badges
+        [f'<span class="pill" data-pill="{html.escape(badge)}">{html.escape(badge)}</span>' for badge in badges]
     )
     category_badges = split_badges(distro.get("category", ""))
     category_markup = "".join(
-        f'<span class="eyebrow-chip">{html.escape(label)}</span>' for label in category_badges
+        [f'<span class="eyebrow-chip">{html.escape(label)}</span>' for label in category_badges]
     )
-    best_for = distro.get("compatibility", {}).get("best_for") or []
-    not_ideal = distro.get("compatibility", {}).get("not_ideal_for") or []
-    use_cases = distro.get("compatibility", {}).get("use_cases") or []
+    compatibility = distro.get("compatibility", {})
+    best_for = compatibility.get("best_for") or []
+    not_ideal = compatibility.get("not_ideal_for") or []
+    use_cases = compatibility.get("use_cases") or []
     target_users = distro.get("target_users") or []
     family = distro.get("family") or ""
     distro_badges = distro.get("badges") or []
-    keyword_terms = distro_badges
     badge_chip_markup = "".join(
-        f'<span class="tag-pill">{safe_text(label)}</span>' for label in distro_badges
+        [f'<span class="tag-pill">{safe_text(label)}</span>' for label in distro_badges]
     )
     download_url = distro.get("download_url") or ""
     official_site = distro.get("website") or ""
 
+    # Shared by the hero meta grid and the overview cards.
+    origin = distro.get("origin") or "Global"
+    architectures = ", ".join(distro.get("architecture") or [])
+    desktop = distro.get("desktop") or "Multiple"
+    package_manager = distro.get("package_manager") or "Unknown"
     hero_meta = [
-        ("Origin", distro.get("origin") or "Global"),
+        ("Origin", origin),
         ("First release", distro.get("first_release") or "Unknown"),
-        (
-            "Architectures",
-            ", ".join(distro.get("architecture") or []),
-        ),
-        ("Desktop", distro.get("desktop") or "Multiple"),
-        ("Package manager", distro.get("package_manager") or "Unknown"),
+        ("Architectures", architectures),
+        ("Desktop", desktop),
+        ("Package manager", package_manager),
     ]
-    hero_meta_markup = "".join(
-        f"""
-        <article>
-          <p class="muted-label">{safe_text(label)}</p>
-          <p class="data-value">{safe_text(value)}</p>
-        </article>
-        """
-        for label, value in hero_meta
-        if value
-    )
+    hero_meta_markup = data_cards(hero_meta)
     hero_buttons: list[str] = []
     if download_url:
         hero_buttons.append(
-            f'<a class="primary-btn" href="{html.escape(download_url)}" target="_blank" rel="noopener">Download {safe_text(name)}</a>'
+            f'<a class="primary-btn" href="{html.escape(download_url)}" target="_blank" rel="noopener">Download {name_esc}</a>'
         )
     if official_site:
         hero_buttons.append(
@@ -242,37 +713,31 @@ def render_detail_page(distro: dict, last_updated: str, all_distros: list[dict])
     hero_actions_markup = "\n                    ".join(hero_buttons)
 
     info_cards = [
-        ("Origin", distro.get("origin") or "Global"),
-        ("Architectures", ", ".join(distro.get("architecture") or [])),
-        ("Desktop environment", distro.get("desktop") or "Multiple"),
-        ("Package manager", distro.get("package_manager") or "Unknown"),
+        ("Origin", origin),
+        ("Architectures", architectures),
+        ("Desktop environment", desktop),
+        ("Package manager", package_manager),
         ("Release model", release_model),
         ("Status", distro.get("status") or "Active"),
     ]
-    info_markup = "".join(
-        f"""
-        <article>
-          <p class="muted-label">{safe_text(label)}</p>
-          <p class="data-value">{safe_text(value)}</p>
-        </article>
-        """
-        for label, value in info_cards
-        if value
-    )
+    info_markup = data_cards(info_cards)
 
-    pros_markup = "".join(f"<li>{safe_text(item)}</li>" for item in distro.get("pros", []))
-    cons_markup = "".join(f"<li>{safe_text(item)}</li>" for item in distro.get("cons", []))
+    pros_markup = list_items(distro.get("pros", []))
+    cons_markup = list_items(distro.get("cons", []))
 
-    hw_min = distro.get("hardware_requirements", {}).get("minimum") or {}
-    hw_rec = distro.get("hardware_requirements", {}).get("recommended") or {}
+    hardware = distro.get("hardware_requirements", {})
+    hw_min = hardware.get("minimum") or {}
+    hw_rec = hardware.get("recommended") or {}
     hw_rows = [
         ("CPU", hw_min.get("cpu"), hw_rec.get("cpu")),
         ("RAM", hw_min.get("ram"), hw_rec.get("ram")),
         ("Storage", hw_min.get("storage"), hw_rec.get("storage")),
     ]
     hw_markup = "".join(
-        f"<tr><td>{safe_text(spec)}</td><td>{safe_text(low or 'Not listed')}</td><td>{safe_text(high or 'Not listed')}</td></tr>"
-        for spec, low, high in hw_rows
+        [
+            f"<tr><td>{safe_text(spec)}</td><td>{safe_text(low or 'Not listed')}</td><td>{safe_text(high or 'Not listed')}</td></tr>"
+            for spec, low, high in hw_rows
+        ]
     )
 
     package_description = distro.get("package_manager_explained") or ""
@@ -286,12 +751,14 @@ def render_detail_page(distro: dict, last_updated: str, all_distros: list[dict])
     screenshots = distro.get("screenshots") or []
     screenshot_sources = screenshots or build_placeholder_screenshots(name)
     screenshot_markup = "".join(
-        f"""
+        [
+            f"""
         <div class="screenshot-card" data-full="{html.escape(url)}">
-          <img src="{html.escape(url)}" alt="{safe_text(name)} screenshot" loading="lazy" decoding="async" />
+          <img src="{html.escape(url)}" alt="{name_esc} screenshot" loading="lazy" decoding="async" />
         </div>
         """
-        for url in screenshot_sources
+            for url in screenshot_sources
+        ]
     )
 
     benchmarks = distro.get("benchmarks") or {}
@@ -306,32 +773,34 @@ def render_detail_page(distro: dict, last_updated: str, all_distros: list[dict])
         ("Power user score", power),
     ]
     score_markup = "".join(
-        (
-            f"""
+        [
+            (
+                f"""
         <div class="score-row">
           <span>{html.escape(label)}</span>
           <div class="score-bar"><span style="width: {min(score,10)*10}%"></span></div>
           <strong>{score}/10</strong>
         </div>
         """
-            if score
-            else f"""
+                if score
+                else f"""
         <div class="score-row pending">
           <span>{html.escape(label)}</span>
           <p class="muted">Not rated yet</p>
         </div>
         """
-        )
-        for label, score in score_rows
+            )
+            for label, score in score_rows
+        ]
     )
-    related_markup = build_related_distro_cards(distro, all_distros)
+    related_markup = build_related_distro_cards(index, columns, all_distros)
 
     target_markup = "".join(
-        f'<span class="user-pill">{safe_text(user)}</span>' for user in target_users
+        [f'<span class="user-pill">{safe_text(user)}</span>' for user in target_users]
     )
-    best_markup = "".join(f"<li>{safe_text(item)}</li>" for item in best_for)
-    not_ideal_markup = "".join(f"<li>{safe_text(item)}</li>" for item in not_ideal)
-    use_case_markup = "".join(f"<li>{safe_text(item)}</li>" for item in use_cases)
+    best_markup = list_items(best_for)
+    not_ideal_markup = list_items(not_ideal)
+    use_case_markup = list_items(use_cases)
 
     keywords = [
         name,
@@ -343,242 +812,112 @@ def render_detail_page(distro: dict, last_updated: str, all_distros: list[dict])
     ]
     meta_keywords = ", ".join(filter(None, keywords))
 
-    screenshot_urls = screenshot_sources
     schema_logo = absolute_media_url(distro.get("logo") or distro.get("logo_source") or "")
-    schema_app = {
-        "@context": "https://schema.org",
-        "@type": "SoftwareApplication",
-        "applicationCategory": "UtilitiesApplication",
-        "operatingSystem": "GNU/Linux",
-        "name": name,
-        "description": meta_description_text,
-        "image": schema_logo,
-        "url": f"{BASE_URL}/distros/{distro['id']}.html",
-        "softwareVersion": str(distro.get("first_release", "")),
-        "publisher": {"@type": "Organization", "name": "BESTLINUXDISTROS"},
-        "offers": {"@type": "Offer", "price": "0", "priceCurrency": "USD"},
-        "releaseNotes": f"{release_model} cadence - {distro.get('status', 'Active')}",
-        "downloadUrl": download_url or official_site,
-        "screenshot": screenshot_urls,
-        "keywords": keyword_terms,
+    page_url = f"{BASE_URL}/distros/{distro['id']}.html"
+    developer = distro.get("developer")
+    developer_org = (
+        f'{{"@type":"Organization","name":{dump_json(developer)}}}' if developer else ""
+    )
+    schema_json = SCHEMA_TEMPLATE % {
+        "name": dump_json(name),
+        "description": dump_json(meta_description_text),
+        "logo": dump_json(schema_logo),
+        "url": dump_json(page_url),
+        "version": dump_json(str(distro.get("first_release", ""))),
+        "release_notes": dump_json(f"{release_model} cadence - {distro.get('status', 'Active')}"),
+        "download_url": dump_json(download_url or official_site),
+        "screenshots": dump_json(screenshot_sources),
+        "keywords": dump_json(distro_badges),
+        "os_type": dump_json(family or "Linux"),
+        "og_image": dump_json(f"{BASE_URL}/assets/og/{distro['id']}.png"),
+        "provider": f',"provider":{developer_org}' if developer else "",
+        "manufacturer": f',"manufacturer":{developer_org}' if developer else "",
     }
-    schema_os = {
-        "@context": "https://schema.org",
-        "@type": "OperatingSystem",
-        "name": name,
-        "url": f"{BASE_URL}/distros/{distro['id']}.html",
-        "description": meta_description_text,
-        "operatingSystemType": family or "Linux",
-        "screenshot": screenshot_urls,
-        "softwareVersion": str(distro.get("first_release", "")),
-        "image": f"{BASE_URL}/assets/og/{distro['id']}.png",
+
+    context = {
+        "name": name_esc,
+        "distro_id": distro["id"],
+        "page_url": page_url,
+        "og_image_markup": og_image_markup(distro["id"]),
+        "meta_description": meta_description,
+        "meta_keywords": html.escape(meta_keywords),
+        "schema_json": schema_json,
+        "hero_logo": columns["logo_esc"][index],
+        "domain": columns["domain_esc"][index],
+        "category_markup": category_markup,
+        "lede_copy": lede_copy,
+        "tag_badges_markup": (
+            f'<div class="distro-tag-badges">{badge_chip_markup}</div>' if badge_chip_markup else ""
+        ),
+        "status": status,
+        "badge_markup": badge_markup,
+        "hero_meta_markup": hero_meta_markup,
+        "hero_actions_markup": hero_actions_markup,
+        "release_model": columns["release_model_esc"][index],
+        "info_markup": info_markup,
+        "target_markup": target_markup or '<span class="user-pill muted">General purpose installs</span>',
+        "best_markup": best_markup or "<li>General purpose desktops</li>",
+        "not_ideal_markup": not_ideal_markup or "<li>Very old or low-power hardware</li>",
+        "use_case_markup": use_case_markup or "<li>Daily driver workloads</li>",
+        "pros_markup": pros_markup,
+        "cons_markup": cons_markup,
+        "hw_markup": hw_markup,
+        "package_name": package_name,
+        "package_blurb": package_blurb,
+        "screenshot_markup": screenshot_markup or '<p class="muted">Screenshots coming soon.</p>',
+        "boot_time": safe_text(boot_time),
+        "resource_usage": safe_text(resource_usage),
+        "score_markup": score_markup,
+        "related_markup": related_markup,
     }
-    if distro.get("developer"):
-        schema_app["provider"] = {"@type": "Organization", "name": distro["developer"]}
-        schema_os["manufacturer"] = {"@type": "Organization", "name": distro["developer"]}
-    schema_json = json.dumps([schema_app, schema_os], ensure_ascii=False)
-
-    hero_logo = detail_logo_src(distro.get("logo", ""))
-    domain = extract_domain(distro.get("website", ""))
-
-    html_page = dedent(
-        f"""\
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-          <meta charset="UTF-8" />
-          <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-          <title>{safe_text(name)} Linux Review | BESTLINUXDISTROS</title>
-          <meta name="description" content="{meta_description}" />
-          <meta name="keywords" content="{html.escape(meta_keywords)}" />
-          <meta property="og:title" content="{safe_text(name)} Linux Review � BestLinuxDistros" />
-          <meta property="og:description" content="{meta_description}" />
-          <meta property="og:type" content="website" />
-          <meta property="og:url" content="{BASE_URL}/distros/{distro['id']}.html" />
-          <meta property="og:image" content="../assets/og/{distro['id']}.png" />
-          <meta property="twitter:card" content="summary_large_image" />
-          <link rel="canonical" href="{BASE_URL}/distros/{distro['id']}.html" />
-          <link rel="preconnect" href="https://fonts.googleapis.com" />
-          <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin />
-          <link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600;700&display=swap" />
-          <link rel="stylesheet" href="../css/styles.css" />
-          <script type="application/ld+json">
-          {schema_json}
-          </script>
-        </head>
-        <body class="page detail" data-distro="{distro['id']}">
-          <header class="site-header floating">
-            <div class="logo-mark"><a href="../index.html">bestlinuxdistros<span class="dot">.com</span></a></div>
-            <button class="nav-toggle" id="navToggle" aria-expanded="false" aria-label="Toggle navigation" aria-controls="site-nav">
-              <span></span><span></span><span></span>
-            </button>
-            <nav class="primary-nav" id="site-nav">
-              <a href="../index.html">Home</a>
-              <a href="../distros.html">Distros</a>
-              <a href="../compare.html">Compare</a>
-              <a href="../blog/index.html">Blog</a>
-              <a href="../index.html#guides">Guides</a>
-              <a href="../index.html#tools">Tools</a>
-              <a href="../distros.html#search" data-nav-search>Search</a>
-            </nav>
-          </header>
-          <main class="detail-main">
-            <a class="back-link" href="../distros.html">&larr; Back to catalog</a>
-            <section class="detail-card detail-hero">
-              <div class="hero-stack">
-                <div class="hero-logo" data-name="{safe_text(name)}">
-                  <img src="{html.escape(hero_logo)}" alt="{safe_text(name)} logo" loading="lazy" decoding="async" referrerpolicy="no-referrer" data-domain="{html.escape(domain)}" />
-                </div>
-                <div class="hero-content">
-                  <div class="eyebrow">{category_markup}</div>
-                  <h1>{safe_text(name)}</h1>
-                  <p class="lede">{lede_copy}</p>
-                  {f'<div class="distro-tag-badges">{badge_chip_markup}</div>' if badge_chip_markup else ''}
-                  <div class="badge-row">
-                    <span class="status-badge" data-status="{status}">{status}</span>
-                    {badge_markup}
-                  </div>
-                  <div class="hero-meta-grid">
-                    {hero_meta_markup}
-                  </div>
-                  <div class="hero-actions">
-                    {hero_actions_markup}
-                  </div>
-                </div>
-              </div>
-            </section>
-            <nav class="breadcrumb">
-              <a href="../index.html">Home</a>
-              <span>&rsaquo;</span>
-              <a href="../distros.html">Distros</a>
-              <span>&rsaquo;</span>
-              <span>{safe_text(name)}</span>
-            </nav>
-            <section class="detail-card overview-panel">
-              <div class="section-heading">
-                <h2>Overview</h2>
-                <p>This snapshot highlights the {safe_text(release_model)} cadence, default desktop, and tooling so you know what to expect before installing.</p>
-              </div>
-              <div class="info-grid">
-                {info_markup}
-              </div>
-            </section>
-            <section class="detail-card audience-panel">
-              <h2>Audience fit</h2>
-              <div class="user-badges">
-                {target_markup or '<span class="user-pill muted">General purpose installs</span>'}
-              </div>
-              <div class="compat-grid">
-                <article>
-                  <h3>Best suited for</h3>
-                  <ul>{best_markup or '<li>General purpose desktops</li>'}</ul>
-                </article>
-                <article>
-                  <h3>Consider alternatives if</h3>
-                  <ul>{not_ideal_markup or '<li>Very old or low-power hardware</li>'}</ul>
-                </article>
-                <article>
-                  <h3>Common deployments</h3>
-                  <ul>{use_case_markup or '<li>Daily driver workloads</li>'}</ul>
-                </article>
-              </div>
-            </section>
-            <section class="detail-card pros-cons">
-              <div>
-                <h3>Pros</h3>
-                <ul>{pros_markup}</ul>
-              </div>
-              <div>
-                <h3>Cons</h3>
-                <ul>{cons_markup}</ul>
-              </div>
-            </section>
-            <section class="detail-card hardware-panel">
-              <h2>Hardware requirements</h2>
-              <table class="hw-table">
-                <thead>
-                  <tr>
-                    <th>Spec</th>
-                    <th>Minimum</th>
-                    <th>Recommended</th>
-                  </tr>
-                </thead>
-                <tbody>
-                  {hw_markup}
-                </tbody>
-              </table>
-            </section>
-            <section class="detail-card package-panel">
-              <h2>Package manager &amp; ecosystem</h2>
-              <p class="package-name">{package_name}</p>
-              <p>{package_blurb}</p>
-            </section>
-            <section class="detail-card screenshots-panel">
-              <div class="section-heading">
-                <h2>Screenshots</h2>
-                <p>Tap or click to open full-size UI captures.</p>
-              </div>
-              <div class="screenshots-grid">
-                {screenshot_markup or '<p class="muted">Screenshots coming soon.</p>'}
-              </div>
-            </section>
-            <section class="detail-card benchmark-panel">
-              <h2>Benchmarks &amp; signals</h2>
-              <div class="benchmark-grid">
-                <article>
-                  <p class="muted-label">Boot time</p>
-                  <span class="pill soft">{safe_text(boot_time)}</span>
-                </article>
-                <article>
-                  <p class="muted-label">Resource usage</p>
-                  <span class="pill soft">{safe_text(resource_usage)}</span>
-                </article>
-              </div>
-              <div class="score-list">
-                {score_markup}
-              </div>
-            </section>
-            {related_markup}
-            <a class="back-link bottom" href="../distros.html">&larr; Back to catalog</a>
-          </main>
-          <footer class="site-footer">
-            <div>
-              <p>Made by Saif &middot;  </p>
-              <p class="last-updated" data-last-updated="{last_updated}">Last updated {last_updated}</p>
-            </div>
-            <div class="footer-links">
-              <a href="../index.html#about">About</a>
-              <a href="mailto:hello@bestlinuxdistros.com">Contact</a>
-              <a href="../index.html#privacy">Privacy</a>
-              <a href="../sitemap.xml">Sitemap</a>
-              <a href="https://github.com/bestlinuxdistros" target="_blank" rel="noopener">GitHub</a>
-            </div>
-            <p class="footer-note">&copy; 2025 BestLinuxDistros.com &mdash; Open-Source Project. Made for Linux users, by Linux users.</p>
-          </footer>
-          <script src="../js/distro-data.js" defer></script>
-          <script src="../js/app.js" defer></script>
-          <script src="../js/detail.js" defer></script>
-        </body>
-        </html>
-        """
+    return "".join(
+        [
+            DETAIL_HEAD_TEMPLATE.format_map(context),
+            SITE_HEADER,
+            DETAIL_BODY_TEMPLATE.format_map(context),
+            SITE_FOOTER,
+        ]
+    )
+
+
+def data_cards(rows: list[tuple[str, str]]) -> str:
+    return "".join(
+        [
+            DATA_CARD_TEMPLATE.format(label=safe_text(label), value=safe_text(value))
+            for label, value in rows
+            if value
+        ]
     )
-    return html_page
+
+
+def list_items(items: list[str]) -> str:
+    return "".join([f"<li>{safe_text(item)}</li>" for item in items])
+
+
+def og_image_markup(distro_id: str) -> str:
+    """WebP first for clients that take it, PNG for the ones that do not."""
+    png_tag = f'<meta property="og:image" content="../assets/og/{distro_id}.png" />'
+    if not OG_WEBP:
+        return png_tag
+    webp_tag = f'<meta property="og:image" content="../assets/og/{distro_id}.webp" />'
+    return f"{webp_tag}\n  {png_tag}"
 
 
 def build_badges(distro: dict, release_model: str) -> list[str]:
     badges: list[str] = []
+    meta = DISTRO_META[distro["id"]]
     category = (distro.get("category") or "").lower()
     if (
         "beginner" in category
-        or distro["id"] in BEGINNER_HINTS
+        or meta.is_beginner
         or int(distro.get("benchmarks", {}).get("beginner_score", 0)) >= 8
     ):
         badges.append("Beginner")
-    if "server" in category or distro["id"] in SERVER_HINTS:
+    if "server" in category or meta.is_server:
         badges.append("Server")
-    if "security" in category or distro["id"] in SECURITY_HINTS:
+    if "security" in category or meta.is_security:
         badges.append("Security")
-    if release_model in {"LTS", "Rolling"}:
+    if release_model in BADGED_RELEASE_MODELS:
         badges.append(release_model)
     return dedupe_list(badges)
 
@@ -593,15 +932,10 @@ def split_badges(raw: str) -> list[str]:
 
 
 def dedupe_list(items: list[str]) -> list[str]:
-    seen = set()
-    deduped = []
-    for item in items:
-        if item not in seen:
-            deduped.append(item)
-            seen.add(item)
-    return deduped
+    return list(dict.fromkeys(items))
 
 
+@lru_cache(maxsize=256)
 def normalize_url(value: str) -> str:
     if not value:
         return ""
@@ -631,13 +965,20 @@ def ensure_local_logo(distro_id: str, logo_url: str, website: str = "", display_
         filename = f"{distro_id}{suffix}"
         target = LOGO_DIR / filename
         rel_path = f"assets/logos/{filename}"
-        if target.exists() and target.stat().st_size > 0:
+        if has_content(target):
+            if OFFLINE or not validators_path(target).exists():
+                return rel_path
+            try:
+                with MEDIA_FETCH_SLOTS:
+                    conditional_fetch(source_url, target, timeout=15)
+            except Exception as exc:
+                print(f"[BLD] Could not revalidate logo for {distro_id} from {source_url}: {exc}")
             return rel_path
+        if OFFLINE:
+            continue
         try:
-            req = Request(source_url, headers=UA_HEADER)
-            with urlopen(req, timeout=15) as response:
-                data = response.read()
-            target.write_bytes(data)
+            with MEDIA_FETCH_SLOTS:
+                conditional_fetch(source_url, target, timeout=15)
             return rel_path
         except Exception as exc:
             print(f"[BLD] Failed to cache logo for {distro_id} from {source_url}: {exc}")
@@ -645,6 +986,78 @@ def ensure_local_logo(distro_id: str, logo_url: str, website: str = "", display_
     return build_logo_placeholder(distro_id, display_name or distro_id)
 
 
+def http_get(
+    url: str, timeout: int, headers: dict | None = None, max_bytes: int | None = None
+) -> tuple[int, bytes, dict]:
+    """
+    GET url through the shared session, or plain urllib when requests is missing.
+    Returns (status, body, headers); 304 is returned, any other error status raises.
+    A Content-Length above max_bytes raises before the body is downloaded.
+    """
+    if SESSION is not None:
+        with SESSION.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code != 304:
+                response.raise_for_status()
+            check_content_length(url, response.headers, max_bytes)
+            return response.status_code, response.content, response.headers
+    try:
+        with urlopen(Request(url, headers={**UA_HEADER, **(headers or {})}), timeout=timeout) as response:
+            check_content_length(url, response.headers, max_bytes)
+            return response.status, response.read(), response.headers
+    except HTTPError as exc:
+        if exc.code == 304:
+            return 304, b"", exc.headers
+        raise
+
+
+def check_content_length(url: str, headers, max_bytes: int | None) -> None:
+    length = headers.get("Content-Length")
+    if max_bytes is not None and length and length.isdigit() and int(length) > max_bytes:
+        raise ValueError(f"{url} is {int(length)} bytes, over the {max_bytes} byte limit")
+
+
+def validators_path(target: Path) -> Path:
+    return target.with_name(f"{target.name}.meta.json")
+
+
+def conditional_fetch(url: str, target: Path, timeout: int, max_bytes: int | None = None) -> bool:
+    """
+    Download url into target, revalidating an existing copy with the
+    ETag/Last-Modified stored in its .meta.json sidecar.
+    Returns True when the server answered 304 and target was left untouched.
+    """
+    meta_path = validators_path(target)
+    headers: dict[str, str] = {}
+    if target.exists() and meta_path.exists():
+        meta = load_json_bytes(meta_path.read_bytes())
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    status, data, response_headers = http_get(url, timeout, headers, max_bytes)
+    if status == 304:
+        return True
+    meta = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+    target.parent.mkdir(parents=True, exist_ok=True)
+    write_file(target, data)
+    if meta["etag"] or meta["last_modified"]:
+        write_file(meta_path, json.dumps(meta))
+    else:
+        meta_path.unlink(missing_ok=True)
+    return False
+
+
+def has_content(path: Path) -> bool:
+    """Non-empty file check with a single stat() call."""
+    try:
+        return os.stat(path).st_size > 0
+    except FileNotFoundError:
+        return False
+
+
 def infer_logo_suffix(url: str) -> str:
     suffix = Path(urlparse(url).path).suffix.lower()
     if suffix in LOGO_SUFFIXES:
@@ -657,19 +1070,19 @@ def build_logo_placeholder(distro_id: str, name: str) -> str:
     filename = f"{distro_id}-placeholder.png"
     target = LOGO_DIR / filename
     rel_path = f"assets/logos/{filename}"
-    if target.exists() and target.stat().st_size > 0:
+    if has_content(target):
         return rel_path
-    if Image is None:
-        target.write_bytes(BLANK_PNG)
+    if PIL is None:
+        write_file(target, BLANK_PNG)
         return rel_path
-    size = 256
-    canvas = Image.new("RGBA", (size, size), "#050914")
+    _, ImageDraw, _, _ = _get_pil()
+    background, font = placeholder_template()
+    size = background.width
+    canvas = background.copy()
     draw = ImageDraw.Draw(canvas)
-    draw.ellipse((0, 0, size, size), fill="#111835")
     initials = "".join(word[0] for word in (name or distro_id).split() if word)[:2].upper()
     if not initials:
         initials = distro_id[:2].upper()
-    font = choose_font(120)
     try:
         bbox = draw.textbbox((0, 0), initials, font=font)
         text_w = bbox[2] - bbox[0]
@@ -682,10 +1095,26 @@ def build_logo_placeholder(distro_id: str, name: str) -> str:
         font=font,
         fill=(51, 255, 87, 255),
     )
-    canvas.convert("RGBA").save(target, "PNG", optimize=True)
+    # Flat two-colour art compresses fine at level 1; optimize=True only burned CPU.
+    canvas.save(target, "PNG", optimize=False, compress_level=1)
     return rel_path
 
 
+_PLACEHOLDER_TEMPLATE: tuple | None = None
+
+
+def placeholder_template():
+    """Build the shared placeholder circle and initials font on first use."""
+    global _PLACEHOLDER_TEMPLATE
+    if _PLACEHOLDER_TEMPLATE is None:
+        Image, ImageDraw, _, _ = _get_pil()
+        size = 256
+        background = Image.new("RGBA", (size, size), "#050914")
+        ImageDraw.Draw(background).ellipse((0, 0, size, size), fill="#111835")
+        _PLACEHOLDER_TEMPLATE = (background, choose_font(120))
+    return _PLACEHOLDER_TEMPLATE
+
+
 def detail_logo_src(path: str) -> str:
     if not path:
         return ""
@@ -710,10 +1139,21 @@ def absolute_media_url(path: str) -> str:
     return f"{BASE_URL}/{trimmed.lstrip('./')}"
 
 
+_ESCAPE_CACHE: dict[str, str] = {}
+
+
 def safe_text(value: object) -> str:
-    return html.escape(str(value)) if value is not None else ""
+    # Labels like "Active", "LTS" or "Not listed" repeat on every page; escape each once.
+    if value is None:
+        return ""
+    text = str(value)
+    escaped = _ESCAPE_CACHE.get(text)
+    if escaped is None:
+        escaped = _ESCAPE_CACHE[text] = html.escape(text)
+    return escaped
 
 
+@lru_cache(maxsize=256)
 def extract_domain(url: str) -> str:
     try:
         hostname = urlparse(url).hostname or ""
@@ -722,6 +1162,75 @@ def extract_domain(url: str) -> str:
         return ""
 
 
+def write_file(path: Path, data: str | bytes) -> None:
+    """
+    Write data with raw os.write calls into a temp file, then rename it over
+    path so readers never observe a half-written page or asset.
+    """
+    payload = data.encode("utf-8") if isinstance(data, str) else data
+    fd, tmp_path = open_temp_for(path)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def write_stream(path: Path, chunks: Iterable[bytes]) -> None:
+    """Like write_file, but for output produced piece by piece: nothing is joined in memory."""
+    fd, tmp_path = open_temp_for(path)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def open_temp_for(path: Path) -> tuple[int, str]:
+    """
+    Create a uniquely named temp file next to path. Fetch threads may write the
+    same target concurrently, so the name cannot be derived from the pid alone.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    # mkstemp creates 0600; published pages and assets must stay world-readable.
+    os.fchmod(fd, 0o644)
+    return fd, tmp_path
+
+
+def load_json_bytes(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json(value: object) -> str:
+    """Serialize to compact JSON, keeping non-ASCII characters as-is."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_snapshot_screenshots() -> dict[str, list[str]]:
+    """Screenshots per distro id from the existing js/distro-data.js, if there is one."""
+    try:
+        raw = SNAPSHOT_PATH.read_bytes()
+        blob = raw.strip().removeprefix(b"window.__BLD_DATA__=").removesuffix(b";")
+        payload = load_json_bytes(blob)
+    except (OSError, ValueError) as exc:
+        print(f"[BLD] Offline: could not read previous screenshots from {SNAPSHOT_PATH.name}: {exc}")
+        return {}
+    return {item["id"]: item.get("screenshots") or [] for item in payload.get("distros", [])}
+
+
 def write_snapshot(
     distros: list[dict], generated_at: str, last_updated_display: str
 ) -> None:
@@ -730,163 +1239,263 @@ def write_snapshot(
         "lastUpdatedDisplay": last_updated_display,
         "distros": distros,
     }
-    json_blob = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    json_blob = dump_json(payload)
     js_body = f"window.__BLD_DATA__={json_blob};"
-    SNAPSHOT_PATH.write_text(js_body, encoding="utf-8")
+    write_file(SNAPSHOT_PATH, js_body)
+
+
+SITEMAP_HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+# Hand-written pages; distro detail pages are appended at build time.
+_STATIC_PATHS = (
+    "",
+    "/index.html",
+    "/distros.html",
+    "/compare.html",
+    "/blog/index.html",
+    "/blog/best-linux-distros-for-beginners-2025.html",
+    "/blog/best-linux-distros-for-developers-and-programmers-2025.html",
+    "/blog/best-lightweight-linux-distros-for-old-laptops-2025.html",
+    "/blog/best-rolling-release-linux-distros-2025.html",
+    "/blog/best-linux-distros-for-gaming-and-steam-deck-2025.html",
+    "/blog/best-linux-distros-for-servers-and-cloud-2025.html",
+    "/blog/best-linux-distros-for-security-and-penetration-testing-2025.html",
+    "/blog/best-linux-distros-for-data-science-and-ai-2025.html",
+    "/blog/best-linux-distros-for-designers-and-creatives-2025.html",
+    "/blog/homelab-linux-distros-and-tools-2025.html",
+    "/blog/best-linux-distros-for-privacy-and-anonymity-2025.html",
+    "/blog/best-linux-distros-for-raspberry-pi-and-arm-2025.html",
+    "/blog/linux-distros-for-educators-and-classrooms-2025.html",
+    "/guides/index.html",
+    "/guides/linux-beginners-guide-2025.html",
+    "/guides/linux-security-hardening-2025.html",
+    "/guides/how-to-choose-a-linux-distro.html",
+    "/guides/linux-performance-tuning-2025.html",
+    "/tools/index.html",
+    "/tools/hardware-compatibility-checker.html",
+    "/tools/package-manager-cheatsheet.html",
+    "/tools/kernel-update-guide.html",
+    "/tools/linux-filesystem-explained.html",
+)
 
 
 def write_sitemap(distros: list[dict], lastmod: str) -> None:
-    urls = [
-        ("", lastmod),
-        ("/index.html", lastmod),
-        ("/distros.html", lastmod),
-        ("/compare.html", lastmod),
-        ("/blog/index.html", lastmod),
-        ("/blog/best-linux-distros-for-beginners-2025.html", lastmod),
-        ("/blog/best-linux-distros-for-developers-and-programmers-2025.html", lastmod),
-        ("/blog/best-lightweight-linux-distros-for-old-laptops-2025.html", lastmod),
-        ("/blog/best-rolling-release-linux-distros-2025.html", lastmod),
-        ("/blog/best-linux-distros-for-gaming-and-steam-deck-2025.html", lastmod),
-        ("/blog/best-linux-distros-for-servers-and-cloud-2025.html", lastmod),
-        ("/blog/best-linux-distros-for-security-and-penetration-testing-2025.html", lastmod),
-        ("/blog/best-linux-distros-for-data-science-and-ai-2025.html", lastmod),
-        ("/blog/best-linux-distros-for-designers-and-creatives-2025.html", lastmod),
-        ("/blog/homelab-linux-distros-and-tools-2025.html", lastmod),
-        ("/blog/best-linux-distros-for-privacy-and-anonymity-2025.html", lastmod),
-        ("/blog/best-linux-distros-for-raspberry-pi-and-arm-2025.html", lastmod),
-        ("/blog/linux-distros-for-educators-and-classrooms-2025.html", lastmod),
-        ("/guides/index.html", lastmod),
-        ("/guides/linux-beginners-guide-2025.html", lastmod),
-        ("/guides/linux-security-hardening-2025.html", lastmod),
-        ("/guides/how-to-choose-a-linux-distro.html", lastmod),
-        ("/guides/linux-performance-tuning-2025.html", lastmod),
-        ("/tools/index.html", lastmod),
-        ("/tools/hardware-compatibility-checker.html", lastmod),
-        ("/tools/package-manager-cheatsheet.html", lastmod),
-        ("/tools/kernel-update-guide.html", lastmod),
-        ("/tools/linux-filesystem-explained.html", lastmod),
-    ]
-    for distro in distros:
-        urls.append((f"/distros/{distro['id']}.html", lastmod))
-    urlset = "\n".join(
-        f"  <url><loc>{BASE_URL}{path}</loc><lastmod>{lastmod}</lastmod></url>"
-        for path, lastmod in urls
+    url_open = f"  <url><loc>{BASE_URL}".encode("utf-8")
+    url_close = f"</loc><lastmod>{lastmod}</lastmod></url>\n".encode("utf-8")
+    paths = chain(_STATIC_PATHS, (f"/distros/{distro['id']}.html" for distro in distros))
+    write_stream(
+        SITEMAP_PATH,
+        chain(
+            (SITEMAP_HEADER,),
+            (url_open + path.encode("utf-8") + url_close for path in paths),
+            (b"</urlset>\n",),
+        ),
     )
-    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{urlset}
-</urlset>
-"""
-    SITEMAP_PATH.write_text(xml, encoding="utf-8")
 
 
-def build_related_distro_cards(distro: dict, distros: list[dict], limit: int = 3) -> str:
-    current_id = distro["id"]
-    current_family = (distro.get("family") or "").lower()
-    current_badges = {b.lower() for b in (distro.get("badges") or [])}
-    scored: list[tuple[float, dict]] = []
-    for other in distros:
-        if other["id"] == current_id:
+def build_related_distro_cards(
+    index: int, columns: dict[str, list], distros: list[dict], limit: int = 3
+) -> str:
+    family_lc = columns["family_lc"]
+    badges_lc = columns["badges_lc"]
+    current_family = family_lc[index]
+    current_badges = badges_lc[index]
+    # Integer scores: 2 for a shared family plus one per shared badge.
+    scored: list[tuple[int, int]] = []
+    for other_index in range(len(distros)):
+        if other_index == index:
             continue
-        score = 0.0
-        if current_family and (other.get("family") or "").lower() == current_family:
-            score += 2.0
-        other_badges = {b.lower() for b in (other.get("badges") or [])}
-        score += len(current_badges & other_badges)
+        score = len(current_badges & badges_lc[other_index])
+        if current_family and family_lc[other_index] == current_family:
+            score += 2
         if score > 0:
-            scored.append((score, other))
+            scored.append((score, other_index))
     if len(scored) < limit:
-        existing_ids = {other["id"] for _, other in scored} | {current_id}
-        for other in sorted(distros, key=lambda item: item.get("popularity_rank", 999)):
-            if other["id"] in existing_ids:
+        existing = {other_index for _, other_index in scored} | {index}
+        for other_index in columns["by_popularity"]:
+            if other_index in existing:
                 continue
-            scored.append((0.1, other))
-            existing_ids.add(other["id"])
+            # Popular fillers rank below every real match.
+            scored.append((0, other_index))
+            existing.add(other_index)
             if len(scored) >= limit + 3:
                 break
-    scored.sort(key=lambda item: (-item[0], item[1].get("popularity_rank", 999)))
-    related = [entry for _, entry in scored[:limit]]
-    if not related:
+    scored.sort(key=lambda item: (-item[0], distros[item[1]].get("popularity_rank", 999)))
+    if not scored:
         return ""
-    cards = "".join(
-        f"""
-                <article class="distro-card">
-                  <div class="distro-logo">
-                    <img src="{html.escape(detail_logo_src(other.get('logo', '')))}" alt="{safe_text(other.get('name'))} logo" loading="lazy" decoding="async" referrerpolicy="no-referrer" />
-                  </div>
-                  <h3>{safe_text(other.get('name'))}</h3>
-                  <p class="muted-label">{safe_text(other.get('family') or other.get('category') or '')}</p>
-                  <a class="link-arrow" href="../distros/{other['id']}.html">View details &rsaquo;</a>
-                </article>
-        """
-        for other in related
+    related_card = columns["related_card"]
+    return RELATED_PANEL_TEMPLATE.format(
+        cards="".join([related_card[other_index] for _, other_index in scored[:limit]])
     )
-    return f"""
-            <section class="detail-card related-panel">
-              <div class="section-heading">
-                <h2>You may also like</h2>
-                <p>Explore similar distributions with shared traits.</p>
-              </div>
-              <div class="related-grid">
-                {cards}
-              </div>
-            </section>
-    """
 
 
 def generate_og_image(distro: dict, screenshots: list[str]) -> None:
-    OG_DIR.mkdir(parents=True, exist_ok=True)
-    target = OG_DIR / f"{distro['id']}.png"
-    if Image is None:
-        fallback_og_image(target, screenshots)
+    # OG_DIR is created once by main() before the render pool starts.
+    target, stamp = og_image_paths(distro)
+    webp_target = target.with_suffix(".webp")
+    key = og_image_key(distro, screenshots)
+    if og_image_is_current(target, stamp, key):
+        return
+    if OFFLINE and target.exists() and (webp_target.exists() or not OG_WEBP):
         return
-    width, height = 1200, 630
-    canvas = Image.new("RGBA", (width, height), "#050914")
+    if PIL is None:
+        if fallback_og_image(target, screenshots):
+            write_file(stamp, key)
+        return
+    Image, ImageDraw, ImageFilter, _ = _get_pil()
+    width, height = OG_SIZE
+    darkener, plain_canvas = og_background()
+    canvas = None
+    shot_loaded = False
     if screenshots:
         try:
-            req = Request(screenshots[0], headers=UA_HEADER)
-            with urlopen(req, timeout=10) as response:
-                raw = response.read()
-            shot = Image.open(BytesIO(raw)).convert("RGB")
-            shot = shot.resize((width, height), Image.LANCZOS)
-            shot = shot.filter(ImageFilter.GaussianBlur(radius=18))
-            canvas = shot.convert("RGBA")
+            raw = http_cache_path(screenshots[0]).read_bytes()
+            shot = Image.open(BytesIO(raw))
+            # JPEGs decode straight to the nearest 1/2..1/8 scale covering the blur size.
+            shot.draft("RGB", (width // 4, height // 4))
+            shot = shot.convert("RGB")
+            # Blur at quarter size: the background is a wash, so upscaling
+            # the small blurred copy looks the same as blurring full size.
+            small = shot.resize((width // 4, height // 4), Image.BILINEAR)
+            small = small.filter(ImageFilter.GaussianBlur(radius=5))
+            shot = small.resize((width, height), Image.BILINEAR)
+            canvas = Image.blend(shot, darkener, OG_DARKEN_ALPHA).convert("RGBA")
+            shot_loaded = True
         except Exception:
             pass
-    overlay = Image.new("RGBA", (width, height), (5, 9, 25, 200))
-    canvas = Image.alpha_composite(canvas, overlay)
+    if canvas is None:
+        canvas = plain_canvas.copy()
     draw = ImageDraw.Draw(canvas)
     title_font = choose_font(78)
     subtitle_font = choose_font(34)
     title = distro.get("name", "").upper()
-    try:
-        bbox = draw.textbbox((0, 0), title, font=title_font)
-        text_w = bbox[2] - bbox[0]
-        text_h = bbox[3] - bbox[1]
-    except AttributeError:
-        text_w, text_h = draw.textsize(title, font=title_font)
+    text_w, text_h = text_size(title_font, title)
     text_x = (width - text_w) / 2
     text_y = (height - text_h) / 2
     glow_color = (51, 255, 87, 160)
-    for offset in (-3, -2, 2, 3):
-        draw.text((text_x + offset, text_y + offset), title, font=title_font, fill=glow_color)
-    draw.text((text_x, text_y), title, font=title_font, fill=(236, 244, 255, 255))
+    draw.text(
+        (text_x, text_y),
+        title,
+        font=title_font,
+        fill=(236, 244, 255, 255),
+        stroke_width=3,
+        stroke_fill=glow_color,
+    )
     subtitle = "bestlinuxdistros.com"
-    try:
-        sub_box = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-        sub_w = sub_box[2] - sub_box[0]
-    except AttributeError:
-        sub_w, _ = draw.textsize(subtitle, font=subtitle_font)
+    sub_w, _ = text_size(subtitle_font, subtitle)
     draw.text(
         (width / 2 - sub_w / 2, height * 0.75),
         subtitle,
         font=subtitle_font,
         fill=(140, 255, 210, 220),
     )
-    canvas.convert("RGB").save(target, "PNG", quality=90, optimize=True)
+    rgb = canvas.convert("RGB")
+    # Blurred photos barely shrink under optimize=True; it only burns zlib trials.
+    rgb.save(target, "PNG", compress_level=3)
+    if OG_WEBP:
+        rgb.save(webp_target, "WEBP", quality=82, method=4)
+    # A failed screenshot download leaves a plain background; retry it next build.
+    if shot_loaded or not screenshots:
+        write_file(stamp, key)
 
 
+_OG_BACKGROUND: tuple | None = None
+
+
+def og_background():
+    """
+    Build the darkening layer and the screenshot-less canvas once per process.
+    Blending with the layer matches compositing (5, 9, 25) at alpha 200 on top.
+    """
+    global _OG_BACKGROUND
+    if _OG_BACKGROUND is None:
+        Image = _get_pil()[0]
+        darkener = Image.new("RGB", OG_SIZE, (5, 9, 25))
+        base = Image.new("RGB", OG_SIZE, "#050914")
+        plain_canvas = Image.blend(base, darkener, OG_DARKEN_ALPHA).convert("RGBA")
+        _OG_BACKGROUND = (darkener, plain_canvas)
+    return _OG_BACKGROUND
+
+
+def og_image_paths(distro: dict) -> tuple[Path, Path]:
+    """The OG PNG for a distro and the .sha256 stamp recording its og_image_key."""
+    target = OG_DIR / f"{distro['id']}.png"
+    return target, target.with_name(f"{target.name}.sha256")
+
+
+def og_image_is_current(target: Path, stamp: Path, key: str) -> bool:
+    if not (target.exists() and stamp.exists()):
+        return False
+    return stamp.read_text(encoding="utf-8") == key
+
+
+def http_cache_path(url: str) -> Path:
+    return HTTP_CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+
+
+def cached_get(
+    url: str, ttl: int = HTTP_CACHE_TTL, timeout: int = 10, max_bytes: int | None = None
+) -> bytes:
+    """
+    Return the body of url from the on-disk HTTP cache. The network is only
+    used when the copy is missing or older than ttl, and then via conditional
+    GET. A failed refresh serves the stale copy; --offline never refreshes.
+    """
+    path = http_cache_path(url)
+    try:
+        age = time.time() - os.stat(path).st_mtime
+    except FileNotFoundError:
+        age = None
+    if OFFLINE or (age is not None and age < ttl):
+        return path.read_bytes()
+    try:
+        with MEDIA_FETCH_SLOTS:
+            if conditional_fetch(url, path, timeout=timeout, max_bytes=max_bytes):
+                os.utime(path)
+    except Exception:
+        if age is None:
+            raise
+    return path.read_bytes()
+
+
+def prefetch_og_source(distro: dict) -> None:
+    """Download the screenshot behind a stale OG image into the HTTP cache."""
+    screenshots = distro.get("screenshots") or []
+    if not screenshots or OFFLINE:
+        return
+    if og_image_is_current(*og_image_paths(distro), og_image_key(distro, screenshots)):
+        return
+    try:
+        cached_get(screenshots[0], max_bytes=OG_SOURCE_MAX_BYTES)
+    except Exception as exc:
+        print(f"[BLD] Failed to fetch OG screenshot for {distro['id']}: {exc}")
+
+
+def og_image_key(distro: dict, screenshots: list[str]) -> str:
+    # Only what the artwork draws: the title and the blurred first screenshot.
+    source = (
+        OG_STYLE_VERSION,
+        PIL is not None,
+        OG_WEBP,
+        distro.get("name"),
+        screenshots[0] if screenshots else "",
+    )
+    return hashlib.sha256(repr(source).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _get_pil():
+    """Import Pillow's imaging modules once, on first use."""
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+    return Image, ImageDraw, ImageFilter, ImageFont
+
+
+@lru_cache(maxsize=16)
 def choose_font(size: int):
+    ImageFont = _get_pil()[3]
     for name in ("Arial.ttf", "DejaVuSans-Bold.ttf", "DejaVuSans.ttf"):
         try:
             return ImageFont.truetype(name, size)
@@ -895,24 +1504,37 @@ def choose_font(size: int):
     return ImageFont.load_default()
 
 
-def fallback_og_image(target: Path, screenshots: list[str]) -> None:
+_TEXT_SIZES: dict[tuple, tuple[int, int]] = {}
+
+
+def text_size(font, text: str) -> tuple[int, int]:
+    # The subtitle is identical on every OG image; measure it with FreeType once.
+    key = (getattr(font, "path", None), getattr(font, "size", None), text)
+    size = _TEXT_SIZES.get(key)
+    if size is None:
+        try:
+            bbox = font.getbbox(text)
+            size = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        except AttributeError:
+            size = font.getsize(text)
+        _TEXT_SIZES[key] = size
+    return size
+
+
+def fallback_og_image(target: Path, screenshots: list[str]) -> bool:
+    """Returns False when the screenshot is not in the HTTP cache and a blank image was written."""
     try:
         if screenshots:
-            req = Request(screenshots[0], headers=UA_HEADER)
-            with urlopen(req, timeout=10) as response:
-                data = response.read()
-            target.write_bytes(data)
+            write_file(target, http_cache_path(screenshots[0]).read_bytes())
         else:
-            target.write_bytes(BLANK_PNG)
+            write_file(target, BLANK_PNG)
+        return True
     except Exception:
-        target.write_bytes(BLANK_PNG)
+        write_file(target, BLANK_PNG)
+        return False
 
 
-def fetch_wiki_screenshots(page_title: str) -> list[str]:
-    """
-    Fetch up to 6 screenshots for a distro using Wikipedia API + Wikimedia FilePath.
-    Only returns PNG/JPG images.
-    """
+def wiki_screenshots_url(page_title: str) -> str:
     api_url = "https://en.wikipedia.org/w/api.php"
     params = {
         "action": "query",
@@ -923,12 +1545,16 @@ def fetch_wiki_screenshots(page_title: str) -> list[str]:
         "iiprop": "url",
         "titles": page_title,
     }
+    return f"{api_url}?{urlencode(params)}"
 
+
+def fetch_wiki_screenshots(page_title: str) -> list[str]:
+    """
+    Fetch up to 6 screenshots for a distro using Wikipedia API + Wikimedia FilePath.
+    Only returns PNG/JPG images.
+    """
     try:
-        url = f"{api_url}?{urlencode(params)}"
-        req = Request(url, headers=UA_HEADER)
-        with urlopen(req, timeout=10) as response:
-            data = json.load(response)
+        data = load_json_bytes(cached_get(wiki_screenshots_url(page_title)))
     except Exception:
         return []
 